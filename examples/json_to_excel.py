@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 
-from geoapify_places import export_to_excel
+from geoapify_places import export_to_excel, scan_records
 
 
 def parse_args() -> argparse.Namespace:
@@ -38,13 +37,18 @@ def main() -> None:
     if not args.input_json.exists():
         raise SystemExit(f"Input file not found: {args.input_json}")
 
-    records = json.loads(args.input_json.read_text(encoding="utf-8"))
-    if not isinstance(records, list):
-        raise SystemExit("Input JSON must be a list of business records")
-
     output = args.output or args.input_json.with_suffix(".xlsx")
-    export_to_excel(records, output, sheet_name=args.sheet_name)
-    print(f"Wrote {len(records)} rows to {output}")
+    try:
+        records, headers, count = scan_records(args.input_json)
+        export_to_excel(
+            records,
+            output,
+            sheet_name=args.sheet_name,
+            headers=headers,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+    print(f"Wrote {count} rows to {output}")
 
 
 if __name__ == "__main__":
@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
-from statistics import mean
-from typing import List, Mapping
+from typing import List, Mapping, Tuple
 
 import folium
+import numpy as np
 from folium import Map
-from folium.plugins import HeatMap, MarkerCluster
+from folium.plugins import FastMarkerCluster, HeatMap
 
-from geoapify_places import collect_coordinates
+from geoapify_places import iter_records, record_coordinates
+
+MARKER_CALLBACK = """
+var callback = function (row) {
+    var marker = L.marker(new L.LatLng(row[0], row[1]));
+    marker.bindPopup(row[2]);
+    marker.bindTooltip(row[3]);
+    return marker;
+};"""
 
 
 def parse_args() -> argparse.Namespace:
@@ -79,40 +86,44 @@ def main() -> None:
     if not args.input_json.exists():
         raise SystemExit(f"Input file not found: {args.input_json}")
 
-    records = json.loads(args.input_json.read_text(encoding="utf-8"))
-    if not isinstance(records, list):
-        raise SystemExit("Input JSON must be a list of business records.")
+    coordinates: List[Tuple[float, float]] = []
+    markers: List[Tuple[float, float, str, str]] = []
+    try:
+        for record in iter_records(args.input_json):
+            pair = record_coordinates(record)
+            if pair is None:
+                continue
+            coordinates.append(pair)
+            if args.include_markers:
+                markers.append((*pair, build_popup(record), record.get("name") or "Business"))
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
 
-    coordinates = collect_coordinates(records)
     if not coordinates:
         raise SystemExit("No valid latitude/longitude pairs found in the dataset.")
 
-    center_lat = args.center_lat if args.center_lat is not None else mean(lat for lat, _ in coordinates)
-    center_lon = args.center_lon if args.center_lon is not None else mean(lon for _, lon in coordinates)
+    points = np.asarray(coordinates, dtype=np.float64)
+    mean_lat, mean_lon = points.mean(axis=0)
+    center_lat = args.center_lat if args.center_lat is not None else float(mean_lat)
+    center_lon = args.center_lon if args.center_lon is not None else float(mean_lon)
 
     fmap = folium.Map(location=[center_lat, center_lon], zoom_start=args.zoom_start, tiles=args.tiles)
 
-    heat_data = [[lat, lon] for lat, lon in coordinates]
     HeatMap(
-        heat_data,
+        points.tolist(),
         radius=args.heatmap_radius,
         blur=args.heatmap_blur,
         max_zoom=18,
     ).add_to(fmap)
 
     if args.include_markers:
-        cluster = MarkerCluster(name="Businesses").add_to(fmap)
-        for record in records:
-            lat = record.get("latitude")
-            lon = record.get("longitude")
-            if lat is None or lon is None:
-                continue
-            popup_text = build_popup(record)
-            folium.Marker(
-                location=[lat, lon],
-                popup=popup_text,
-                tooltip=record.get("name") or "Business",
-            ).add_to(cluster)
+        # Markers are built client-side from plain rows, which keeps the HTML
+        # small compared to serializing one folium.Marker per business.
+        FastMarkerCluster(
+            data=[list(marker) for marker in markers],
+            callback=MARKER_CALLBACK,
+            name="Businesses",
+        ).add_to(fmap)
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
     fmap.save(args.output)
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
+import pickle
 from pathlib import Path
-from typing import Iterable, List, Sequence, Tuple
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import EllipseCollection
 
-from geoapify_places import read_sweep_points
+from geoapify_places import _json, read_sweep_points
 
 
 def parse_args() -> argparse.Namespace:
@@ -26,7 +29,7 @@ def parse_args() -> argparse.Namespace:
         "--output",
         type=Path,
         default=Path("plots/north_carolina_sweep.png"),
-        help="PNG path to save the plotted points.",
+        help="Image path to save the plotted points (PNG, PDF, SVG, ...).",
     )
     parser.add_argument(
         "--title",
@@ -72,7 +75,9 @@ def main() -> None:
     colors = range(len(sweep_points))
 
     plt.style.use("seaborn-v0_8")
-    fig, ax = plt.subplots(figsize=(8, 8))
+    # Data artists are rasterized at this DPI so vector outputs (PDF/SVG)
+    # stay small; axes, labels and annotations remain vector.
+    fig, ax = plt.subplots(figsize=(8, 8), dpi=200)
 
     if polygons:
         draw_polygons(ax, polygons, highlight_only=bool(args.state))
@@ -86,8 +91,33 @@ def main() -> None:
         edgecolor="black",
         linewidth=0.8,
         zorder=3,
+        rasterized=True,
     )
 
+    xs = np.asarray(longitudes, dtype=float)
+    ys = np.asarray(latitudes, dtype=float)
+    radii = np.array([radius_to_degrees(point.radius_m) for point in sweep_points])
+    circles = EllipseCollection(
+        widths=2 * radii,
+        heights=2 * radii,
+        angles=0,
+        units="xy",
+        offsets=np.column_stack([xs, ys]),
+        offset_transform=ax.transData,
+        facecolors="none",
+        edgecolors="black",
+        linestyles="--",
+        linewidths=0.8,
+        alpha=0.25,
+    )
+    circles.set_rasterized(True)
+    ax.add_collection(circles)
+    # add_collection only registers the circle centres; include each circle's
+    # full extent so circles (and their labels) at the edges are not clipped.
+    ax.update_datalim(np.column_stack([xs - radii, ys - radii]))
+    ax.update_datalim(np.column_stack([xs + radii, ys + radii]))
+    ax.autoscale_view()
+
     for idx, point in enumerate(sweep_points, start=1):
         label_text = point.label or f"Point {idx}"
         label = f"{idx}. {label_text}"
@@ -102,18 +132,6 @@ def main() -> None:
             zorder=4,
         )
 
-        radius_deg = radius_to_degrees(point.radius_m)
-        circle = plt.Circle(
-            (point.longitude, point.latitude),
-            radius_deg,
-            color="black",
-            fill=False,
-            alpha=0.25,
-            linestyle="--",
-            linewidth=0.8,
-        )
-        ax.add_patch(circle)
-
     ax.set_xlabel("Longitude")
     ax.set_ylabel("Latitude")
     ax.set_title(args.title)
@@ -136,59 +154,85 @@ def load_polygons(path: Path, state_name: str | None) -> List[Tuple[str, List]]:
         print(f"Warning: map file {path} not found; skipping base map.")
         return []
 
-    data = json.loads(path.read_text(encoding="utf-8"))
-    features = data.get("features", [])
-    polygons: List[Tuple[str, List]] = []
+    polygons_by_name = load_polygon_index(path)
     target = state_name.lower().strip() if state_name else None
+    if not target:
+        return [polygon for polygons in polygons_by_name.values() for polygon in polygons]
+
+    polygons = polygons_by_name.get(target)
+    if not polygons:
+        raise SystemExit(f"State '{state_name}' not found in {path}")
+    return polygons
+
+
+def load_polygon_index(path: Path) -> Dict[str, List[Tuple[str, List]]]:
+    """
+    Map lowercased feature names to their `(geom_type, coords)` polygons.
+
+    The parsed index is pickled next to the GeoJSON file and reused until the
+    GeoJSON changes, so repeated runs skip re-parsing the whole file.
+    """
 
-    for feature in features:
+    cache_path = path.with_suffix(".pkl")
+    if cache_path.exists() and cache_path.stat().st_mtime >= path.stat().st_mtime:
+        try:
+            with cache_path.open("rb") as handle:
+                return pickle.load(handle)
+        except (pickle.UnpicklingError, EOFError, AttributeError) as exc:
+            print(f"Warning: ignoring unreadable polygon cache {cache_path}: {exc}")
+
+    data = _json.loads(path.read_bytes())
+    index: Dict[str, List[Tuple[str, List]]] = {}
+    for feature in data.get("features", []):
         geometry = feature.get("geometry")
         if not geometry:
             continue
-        geom_type = geometry.get("type")
-        coords = geometry.get("coordinates")
-        name = (
-            str(feature.get("properties", {}).get("name", "")).lower().strip()
-        )
-        if target and name != target:
-            continue
-        polygons.append((geom_type, coords))
+        name = str((feature.get("properties") or {}).get("name", "")).lower().strip()
+        index.setdefault(name, []).append((geometry.get("type"), geometry.get("coordinates")))
 
-    if target and not polygons:
-        raise SystemExit(f"State '{state_name}' not found in {path}")
-
-    if not target:
-        return polygons
-
-    return polygons
+    # Write then rename so an interrupted run never leaves a truncated cache.
+    temp_path = cache_path.with_suffix(".pkl.tmp")
+    try:
+        with temp_path.open("wb") as handle:
+            pickle.dump(index, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError as exc:
+        print(f"Warning: could not write polygon cache {cache_path}: {exc}")
+    return index
 
 
 def draw_polygons(ax: plt.Axes, polygons: List[Tuple[str, List]], highlight_only: bool) -> None:
     outline_color = "#8c8c8c"
     highlight_color = "#004c6d"
+    rings = []
     for geom_type, coords in polygons:
-        rings = []
         if geom_type == "Polygon":
-            rings = coords
+            rings.extend(coords)
         elif geom_type == "MultiPolygon":
             for poly in coords:
                 rings.extend(poly)
-        else:
-            continue
 
-        for ring in rings:
-            if not ring:
-                continue
-            xs = [point[0] for point in ring]
-            ys = [point[1] for point in ring]
-            ax.plot(
-                xs,
-                ys,
-                color=highlight_color if highlight_only else outline_color,
-                linewidth=1.0 if highlight_only else 0.6,
-                alpha=0.8 if highlight_only else 0.5,
-                zorder=1,
-            )
+    # Stack every ring into one NaN-separated polyline so matplotlib draws a
+    # single Line2D instead of one artist per ring.
+    separator = np.full((1, 2), np.nan)
+    segments = []
+    for ring in rings:
+        if not ring:
+            continue
+        segments.append(np.asarray(ring, dtype=np.float64)[:, :2])
+        segments.append(separator)
+    if not segments:
+        return
+
+    outline = np.concatenate(segments)
+    ax.plot(
+        outline[:, 0],
+        outline[:, 1],
+        color=highlight_color if highlight_only else outline_color,
+        linewidth=1.0 if highlight_only else 0.6,
+        alpha=0.8 if highlight_only else 0.5,
+        zorder=1,
+    )
 
 
 if __name__ == "__main__":
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
 from pathlib import Path
 from typing import List, Sequence
 
-from geoapify_places import GeoapifyPlacesClient, read_sweep_points, sweep_businesses
+from geoapify_places import (
+    GeoapifyPlacesClient,
+    _json,
+    asweep_businesses,
+    read_sweep_points,
+    sweep_businesses,
+)
 
 STATE_POINT_FILES = {
     "north_carolina": Path("data/points_north_carolina.csv"),
@@ -60,6 +66,32 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Where to write the merged JSON results (defaults to <state>_businesses.json).",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=16,
+        help="Number of concurrent API requests to run.",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help="Maximum number of requests to start per second (default: unlimited).",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Issue requests with asyncio/httpx instead of a thread pool "
+        "(--max-workers then caps concurrent requests).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Directory for cached API responses; repeated runs reuse them "
+        "instead of calling Geoapify again (not available with --async).",
+    )
     parser.add_argument(
         "--include-raw",
         action="store_true",
@@ -85,17 +117,25 @@ def main() -> None:
         points.extend(read_sweep_points(file_path))
     categories = parse_categories(args.categories)
 
-    businesses = sweep_businesses(
-        client,
-        points,
-        categories=categories,
-        limit=args.limit,
-        language=args.language,
-    )
+    if args.use_async:
+        businesses = asyncio.run(
+            run_async_sweep(client, points, categories=categories, args=args)
+        )
+    else:
+        businesses = sweep_businesses(
+            client,
+            points,
+            categories=categories,
+            limit=args.limit,
+            language=args.language,
+            max_workers=args.max_workers,
+            rate_limit_per_sec=args.rate_limit,
+            cache_dir=args.cache_dir,
+        )
 
     serialized = [business.to_dict(include_raw=args.include_raw) for business in businesses]
     output_path = determine_output_path(args)
-    output_path.write_text(json.dumps(serialized, indent=2), encoding="utf-8")
+    output_path.write_bytes(_json.dumps(serialized, indent=True))
 
     print(
         f"Collected {len(serialized)} unique businesses from {len(points)} points "
@@ -103,9 +143,32 @@ def main() -> None:
     )
 
 
+async def run_async_sweep(
+    client: GeoapifyPlacesClient,
+    points: Sequence,
+    *,
+    categories: Sequence[str] | None,
+    args: argparse.Namespace,
+) -> List:
+    try:
+        return await asweep_businesses(
+            client,
+            points,
+            categories=categories,
+            limit=args.limit,
+            language=args.language,
+            max_concurrency=args.max_workers,
+            rate_limit_per_sec=args.rate_limit,
+        )
+    finally:
+        await client.aclose()
+
+
 def validate_args(args: argparse.Namespace) -> None:
     if args.states and args.points_file:
         raise SystemExit("Use either --state or --points-file, not both.")
+    if args.use_async and args.cache_dir:
+        raise SystemExit("--cache-dir is only supported by the threaded sweep; drop --async.")
 
 
 def resolve_point_files(args: argparse.Namespace) -> List[Path]:
@@ -0,0 +1,29 @@
+"""Optional mypyc build for the feature parser.
+
+Project metadata lives in ``pyproject.toml``; this file only adds compiled
+extension modules when ``GEOAPIFY_PLACES_MYPYC=1`` is set at build time::
+
+    pip install mypy
+    GEOAPIFY_PLACES_MYPYC=1 pip install --no-build-isolation .
+
+The pure-Python sources are still shipped, and Python imports the compiled
+``models`` extension instead of ``models.py`` when it is present.
+"""
+
+import os
+
+from setuptools import setup
+
+MYPYC_MODULES = ["src/geoapify_places/models.py"]
+
+ext_modules = []
+if os.environ.get("GEOAPIFY_PLACES_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # Only models.py is compiled; silence errors from the modules it would
+    # otherwise pull in through the package __init__.
+    ext_modules = mypycify(
+        ["--follow-imports=silent", "--ignore-missing-imports", *MYPYC_MODULES]
+    )
+
+setup(ext_modules=ext_modules)
@@ -7,10 +7,24 @@ from .exceptions import (
     GeoapifyPlacesError,
     GeoapifyRequestError,
 )
-from .exporters import export_to_csv, export_to_excel, flatten_records
-from .models import Business, business_from_feature, businesses_from_feature_collection
-from .sweeper import SweepPoint, read_sweep_points, sweep_businesses
-from .visualization import collect_coordinates
+from .exporters import collect_headers, export_to_csv, export_to_excel, flatten_records
+from .io import iter_records, scan_records
+from .models import (
+    BUSINESS_EXPORT_FIELDS,
+    Business,
+    business_from_feature,
+    businesses_dataframe_from_feature_collection,
+    businesses_from_feature_collection,
+    iter_businesses_from_feature_collection,
+)
+from .sweeper import (
+    SweepGrid,
+    SweepPoint,
+    asweep_businesses,
+    read_sweep_points,
+    sweep_businesses,
+)
+from .visualization import collect_coordinates, collect_coordinates_array, record_coordinates
 
 __all__ = [
     "API_KEY_ENV_VAR",
@@ -20,15 +34,25 @@ __all__ = [
     "GeoapifyPlacesClient",
     "PlacesQuery",
     "Business",
+    "BUSINESS_EXPORT_FIELDS",
     "business_from_feature",
     "businesses_from_feature_collection",
+    "businesses_dataframe_from_feature_collection",
+    "iter_businesses_from_feature_collection",
+    "collect_headers",
     "export_to_csv",
     "export_to_excel",
     "flatten_records",
+    "iter_records",
+    "scan_records",
     "collect_coordinates",
+    "collect_coordinates_array",
+    "record_coordinates",
     "SweepPoint",
+    "SweepGrid",
     "read_sweep_points",
     "sweep_businesses",
+    "asweep_businesses",
     "GeoapifyPlacesError",
     "GeoapifyApiError",
     "GeoapifyAuthorizationError",
@@ -0,0 +1,50 @@
+"""JSON helpers that prefer orjson (then ujson) when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ujson
+except ImportError:
+    ujson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+# this single type regardless of which backend parsed the payload.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Parse JSON from raw bytes (preferred) or text."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    if ujson is not None:
+        try:
+            return ujson.loads(data)
+        except ValueError as exc:
+            # ujson raises a plain ValueError; normalise it to JSONDecodeError.
+            raise JSONDecodeError(str(exc), "", 0) from exc
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes, optionally indented by two spaces."""
+
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+__all__ = ["JSONDecodeError", "dumps", "loads"]
@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, List, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Iterator, List, Mapping, Sequence, Union
 
 import requests
 from requests import Response, Session
 from requests.exceptions import RequestException
 
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+from . import _json
 from .config import GeoapifySettings, load_settings
 from .exceptions import (
     GeoapifyApiError,
@@ -19,8 +29,35 @@ from .exceptions import (
 )
 from .models import Business, businesses_from_feature_collection
 
+if TYPE_CHECKING:
+    # Responses come from requests or httpx depending on the session in use.
+    HttpResponse = Union[Response, httpx.Response]
+
 
 DEFAULT_TIMEOUT = 10  # seconds
+DEFAULT_POOL_SIZE = 32  # keep-alive connections per host
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_FACTOR = 0.5  # seconds; doubled after every failed attempt
+DEFAULT_MAX_BACKOFF = 30.0  # seconds; upper bound for any single retry delay
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Every transport failure is reported as GeoapifyRequestError, but only
+# transient ones (connection, timeout, protocol) are retried; errors such as an
+# invalid URL or unsupported scheme fail immediately.
+_TRANSPORT_ERRORS: tuple[type[Exception], ...] = (RequestException,)
+_RETRYABLE_ERRORS: tuple[type[Exception], ...] = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+if httpx is not None:
+    _TRANSPORT_ERRORS += (httpx.HTTPError,)
+    _RETRYABLE_ERRORS += (
+        httpx.TimeoutException,
+        httpx.NetworkError,
+        httpx.RemoteProtocolError,
+    )
 
 
 @dataclass
@@ -42,12 +79,26 @@ class GeoapifyPlacesClient:
         self,
         settings: GeoapifySettings | None = None,
         *,
-        session: Session | None = None,
+        session: Session | httpx.Client | None = None,
+        async_session: httpx.AsyncClient | None = None,
         timeout: int | float = DEFAULT_TIMEOUT,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
     ) -> None:
         self.settings = settings or load_settings()
-        self.session = session or requests.Session()
+        self.session: Session | httpx.Client | _ThreadLocalSession = session or _build_session(
+            pool_size, timeout
+        )
+        self.async_session = async_session
         self.timeout = timeout
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self._base_params: Dict[str, Any] = {"apiKey": self.settings.api_key}
+        self._categories_cache: Dict[tuple[str, ...], str] = {}
 
     def search_businesses(
         self,
@@ -62,6 +113,34 @@ class GeoapifyPlacesClient:
     ) -> List[Business]:
         """Query the Places API and return normalized :class:`Business` results."""
 
+        query = PlacesQuery(
+            latitude=latitude,
+            longitude=longitude,
+            radius_m=radius_m,
+            categories=categories,
+            limit=limit,
+            language=language,
+        )
+        return self._search(query, extra_params)
+
+    async def asearch_businesses(
+        self,
+        *,
+        latitude: float,
+        longitude: float,
+        radius_m: int,
+        categories: Sequence[str] | None = None,
+        limit: int = 20,
+        language: str | None = None,
+        extra_params: Mapping[str, Any] | None = None,
+    ) -> List[Business]:
+        """
+        Async counterpart of :meth:`search_businesses` backed by ``httpx.AsyncClient``.
+
+        The async session is created lazily on first use; call :meth:`aclose`
+        before the event loop shuts down to release its connections.
+        """
+
         query = PlacesQuery(
             latitude=latitude,
             longitude=longitude,
@@ -70,6 +149,77 @@ class GeoapifyPlacesClient:
             limit=limit,
             language=language,
         )
+        params = self._build_params(query, extra_params)
+        if self.async_session is None:
+            self.async_session = _build_async_session(self.pool_size, self.timeout)
+
+        attempt = 0
+        while True:
+            try:
+                response = await self.async_session.get(
+                    self.settings.base_url, params=params, timeout=self.timeout
+                )
+            except _TRANSPORT_ERRORS as exc:
+                if attempt >= self.max_retries or not isinstance(exc, _RETRYABLE_ERRORS):
+                    raise GeoapifyRequestError(str(exc)) from exc
+                delay = self._retry_delay(None, attempt)
+            else:
+                if not self._should_retry(response, attempt):
+                    break
+                delay = self._retry_delay(response, attempt)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        payload = self._parse_json_body(self._check_response(response))
+        return businesses_from_feature_collection(payload)
+
+    async def aclose(self) -> None:
+        """Close the async session, if one was opened."""
+
+        if self.async_session is not None:
+            await self.async_session.aclose()
+            self.async_session = None
+
+    def search_many(
+        self,
+        queries: Iterable[PlacesQuery],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        extra_params: Mapping[str, Any] | None = None,
+        rate_limit_per_sec: float | None = None,
+    ) -> Iterator[List[Business]]:
+        """
+        Run several queries concurrently on a thread pool.
+
+        Results are yielded in the same order as ``queries`` so callers that
+        merge them get deterministic output. At most ``2 * max_workers``
+        queries are in flight at once, and ``rate_limit_per_sec`` optionally
+        spaces out request submissions to respect provider quotas.
+
+        Workers share the default httpx client and its connection pool; with
+        the requests fallback each worker thread gets its own session, since
+        ``requests.Session`` is not thread-safe. An injected session is shared
+        as-is and must be safe to use from several threads.
+        """
+
+        if max_workers <= 0:
+            raise GeoapifyClientValidationError("max_workers must be positive")
+        throttle = _RateLimiter(rate_limit_per_sec) if rate_limit_per_sec else None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: Deque[Future[List[Business]]] = deque()
+            for query in queries:
+                if throttle is not None:
+                    throttle.wait()
+                pending.append(executor.submit(self._search, query, extra_params))
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _search(
+        self, query: PlacesQuery, extra_params: Mapping[str, Any] | None
+    ) -> List[Business]:
         params = self._build_params(query, extra_params)
         response = self._perform_request(params)
         payload = self._parse_json_body(response)
@@ -83,28 +233,67 @@ class GeoapifyPlacesClient:
         if query.limit <= 0:
             raise GeoapifyClientValidationError("limit must be positive")
 
-        params: Dict[str, Any] = {
-            "apiKey": self.settings.api_key,
-            "limit": query.limit,
-            "filter": f"circle:{query.longitude},{query.latitude},{int(query.radius_m)}",
-            "bias": f"proximity:{query.longitude},{query.latitude}",
-        }
+        center = f"{query.longitude},{query.latitude}"
+        params = self._base_params.copy()
+        params["limit"] = query.limit
+        params["filter"] = f"circle:{center},{int(query.radius_m)}"
+        params["bias"] = f"proximity:{center}"
         if query.categories:
-            params["categories"] = ",".join(query.categories)
+            params["categories"] = self._join_categories(query.categories)
         if query.language:
             params["lang"] = query.language
         if extra_params:
             params.update(extra_params)
         return params
 
-    def _perform_request(self, params: Mapping[str, Any]) -> Response:
-        try:
-            response = self.session.get(
-                self.settings.base_url, params=params, timeout=self.timeout
-            )
-        except RequestException as exc:
-            raise GeoapifyRequestError(str(exc)) from exc
+    def _join_categories(self, categories: Sequence[str]) -> str:
+        # Sweeps reuse one category list for every point, so join it once.
+        key = tuple(categories)
+        joined = self._categories_cache.get(key)
+        if joined is None:
+            joined = self._categories_cache[key] = ",".join(key)
+        return joined
+
+    def _perform_request(self, params: Mapping[str, Any]) -> HttpResponse:
+        attempt = 0
+        while True:
+            try:
+                response = self.session.get(
+                    self.settings.base_url, params=params, timeout=self.timeout
+                )
+            except _TRANSPORT_ERRORS as exc:
+                if attempt >= self.max_retries or not isinstance(exc, _RETRYABLE_ERRORS):
+                    raise GeoapifyRequestError(str(exc)) from exc
+                delay = self._retry_delay(None, attempt)
+            else:
+                if not self._should_retry(response, attempt):
+                    break
+                delay = self._retry_delay(response, attempt)
+            time.sleep(delay)
+            attempt += 1
 
+        return self._check_response(response)
+
+    def _should_retry(self, response: HttpResponse, attempt: int) -> bool:
+        return response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries
+
+    def _retry_delay(self, response: HttpResponse | None, attempt: int) -> float:
+        """Honor a numeric Retry-After header, else back off exponentially.
+
+        Either way the delay is capped at ``max_backoff`` seconds.
+        """
+
+        delay = self.backoff_factor * (2**attempt)
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after is not None:
+            try:
+                delay = max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        return min(delay, self.max_backoff)
+
+    @staticmethod
+    def _check_response(response: HttpResponse) -> HttpResponse:
         if response.status_code == 401:
             raise GeoapifyAuthorizationError("API key rejected by Geoapify")
 
@@ -115,21 +304,95 @@ class GeoapifyPlacesClient:
         return response
 
     @staticmethod
-    def _parse_json_body(response: Response) -> Mapping[str, Any]:
+    def _parse_json_body(response: HttpResponse) -> Mapping[str, Any]:
         try:
-            return response.json()
-        except json.JSONDecodeError as exc:
+            return _json.loads(response.content)
+        except _json.JSONDecodeError as exc:
             raise GeoapifyApiError(
                 response.status_code, "Geoapify returned invalid JSON"
             ) from exc
 
 
-def _extract_error_message(response: Response) -> str:
+class _RateLimiter:
+    """Space out calls so that at most ``rate`` of them start per second."""
+
+    def __init__(self, rate: float) -> None:
+        if rate <= 0:
+            raise GeoapifyClientValidationError("rate_limit_per_sec must be positive")
+        self.interval = 1.0 / rate
+        self._next_allowed = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Claim the next start slot and return how long to wait for it."""
+
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self.interval
+        return delay
+
+    def wait(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class _ThreadLocalSession:
+    """Hand each thread its own ``requests.Session``, which is not thread-safe."""
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def get(self, url: str, **kwargs: Any) -> Response:
+        session: Session | None = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session.get(url, **kwargs)
+
+
+def _build_session(
+    pool_size: int, timeout: int | float
+) -> httpx.Client | _ThreadLocalSession:
+    """Prefer a shared HTTP/2 httpx client; fall back to per-thread requests sessions."""
+
+    if httpx is not None:
+        try:
+            return httpx.Client(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=pool_size, max_keepalive_connections=pool_size
+                ),
+                timeout=timeout,
+            )
+        except ImportError:
+            # httpx raises ImportError here when the optional h2 package is missing.
+            pass
+
+    # One thread only ever has one request in flight, so the per-thread
+    # sessions keep requests' default connection pool.
+    return _ThreadLocalSession()
+
+
+def _build_async_session(pool_size: int, timeout: int | float) -> httpx.AsyncClient:
+    if httpx is None:
+        raise ImportError(
+            "Async requests need httpx; install it with `pip install geoapify-places[fast]`"
+        )
+
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+    try:
+        return httpx.AsyncClient(http2=True, limits=limits, timeout=timeout)
+    except ImportError:
+        return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+
+def _extract_error_message(response: HttpResponse) -> str:
     try:
-        payload = response.json()
+        payload = _json.loads(response.content)
         if isinstance(payload, dict):
             return payload.get("message") or payload.get("error") or str(payload)
-    except json.JSONDecodeError:
+    except _json.JSONDecodeError:
         pass
     return response.text or f"HTTP {response.status_code}"
 
@@ -5,12 +5,15 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 DEFAULT_BASE_URL = "https://api.geoapify.com/v2/places"
 API_KEY_ENV_VAR = "GEOAPIFY_API_KEY"
 DEFAULT_ENV_FILE = Path(".env")
 
+# Parsed .env contents keyed by (resolved path, mtime in ns).
+_ENV_CACHE: Dict[Tuple[Path, int], Dict[str, str]] = {}
+
 
 @dataclass(frozen=True)
 class GeoapifySettings:
@@ -48,15 +51,28 @@ def _load_env_file(env_file: Optional[Path]) -> None:
         return
 
     path = Path(env_file)
-    if not path.exists():
+    try:
+        key = (path.resolve(), path.stat().st_mtime_ns)
+    except FileNotFoundError:
         return
 
+    values = _ENV_CACHE.get(key)
+    if values is None:
+        values = _ENV_CACHE[key] = _parse_env_file(path)
+
+    for name, value in values.items():
+        os.environ.setdefault(name, value)
+
+
+def _parse_env_file(path: Path) -> Dict[str, str]:
+    values: Dict[str, str] = {}
     for line in path.read_text(encoding="utf-8").splitlines():
         cleaned = line.strip()
         if not cleaned or cleaned.startswith("#") or "=" not in cleaned:
             continue
         key, value = cleaned.split("=", 1)
-        os.environ.setdefault(key.strip(), value.strip())
+        values.setdefault(key.strip(), value.strip())
+    return values
 
 
 __all__ = ["GeoapifySettings", "load_settings", "DEFAULT_BASE_URL", "API_KEY_ENV_VAR"]
@@ -4,79 +4,99 @@ from __future__ import annotations
 
 import json
 import csv
+from itertools import chain, islice
 from pathlib import Path
-from typing import Iterable, List, Mapping, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Sequence, Union, cast
 
-from openpyxl import Workbook
-from openpyxl.utils import get_column_letter
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None  # type: ignore[assignment]
+
+from .models import BUSINESS_EXPORT_FIELDS, Business
 
 Record = Mapping[str, object]
+# Exporters also take Business items directly and write them via to_row().
+ExportRecord = Union[Record, Business]
 
 
-def flatten_records(records: Sequence[Record]) -> tuple[list[str], list[list[object]]]:
+def flatten_records(
+    records: Iterable[Record],
+    *,
+    headers: Sequence[str] | None = None,
+) -> tuple[list[str], Iterator[list[object]]]:
     """
-    Flatten a list of JSON-friendly dictionaries into table rows.
+    Flatten JSON-friendly dictionaries into table rows, one record at a time.
 
     Lists are converted to comma-separated strings, while nested dicts
     are serialized as JSON blobs to keep the output Excel-friendly.
+
+    Rows are produced lazily in a single pass. Without ``headers`` the
+    returned header list grows as new keys are discovered, so rows emitted
+    before a key first appears are shorter; the list is complete once the
+    rows are exhausted. Passing ``headers`` fixes the columns up front and
+    ignores any other keys.
     """
 
-    headers: List[str] = []
-    rows: List[List[object]] = []
+    if headers is not None:
+        fixed = list(headers)
+        return fixed, (_flatten_row(record, fixed) for record in records)
 
-    for record in records:
-        for key in record.keys():
-            if key not in headers:
-                headers.append(key)
+    discovered: List[str] = []
+    return discovered, _iter_discovered_rows(records, discovered)
 
-    for record in records:
-        row: List[object] = []
-        for header in headers:
-            value = record.get(header)
-            row.append(_coerce(value))
-        rows.append(row)
 
-    return headers, rows
+def collect_headers(records: Iterable[Record]) -> list[str]:
+    """Return the union of record keys in first-seen order."""
+
+    # dict.update merges keys in C and preserves first-insertion order;
+    # the values it stores are never read.
+    seen: Dict[str, object] = {}
+    for record in records:
+        seen.update(record)
+    return list(seen)
 
 
 def export_to_excel(
-    records: Sequence[Record],
+    records: Iterable[ExportRecord],
     output_path: str | Path,
     *,
     sheet_name: str = "Businesses",
+    headers: Sequence[str] | None = None,
 ) -> Path:
-    """Write JSON-like records to an Excel workbook."""
-
-    if not records:
-        raise ValueError("No records supplied for export")
-
-    headers, rows = flatten_records(records)
-    workbook = Workbook()
-    worksheet = workbook.active
-    worksheet.title = sheet_name
-
-    worksheet.append(headers)
-    for row in rows:
-        worksheet.append(row)
+    """
+    Write JSON-like records or :class:`Business` items to an Excel workbook.
 
-    _auto_size_columns(worksheet, headers, rows)
+    The header row has to be final before rows are streamed, so one-shot
+    iterators of records are buffered unless ``headers`` is supplied.
+    Businesses default to ``BUSINESS_EXPORT_FIELDS`` and are never buffered.
+    """
 
+    headers, rows = _rows_for_export(records, headers)
     path = Path(output_path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    workbook.save(path)
+    if xlsxwriter is not None:
+        _write_xlsxwriter(path, sheet_name, headers, rows)
+    else:
+        _write_openpyxl(path, sheet_name, headers, rows)
     return path
 
 
 def export_to_csv(
-    records: Sequence[Record],
+    records: Iterable[ExportRecord],
     output_path: str | Path,
+    *,
+    headers: Sequence[str] | None = None,
 ) -> Path:
-    """Write JSON-like records to a CSV file."""
+    """
+    Write JSON-like records or :class:`Business` items to a CSV file.
 
-    if not records:
-        raise ValueError("No records supplied for export")
+    Rows are written as they are flattened; like :func:`export_to_excel`,
+    one-shot iterators of records are buffered unless ``headers`` is
+    supplied, and businesses default to ``BUSINESS_EXPORT_FIELDS``.
+    """
 
-    headers, rows = flatten_records(records)
+    headers, rows = _rows_for_export(records, headers)
     path = Path(output_path)
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", newline="", encoding="utf-8") as handle:
@@ -86,25 +106,134 @@ def export_to_csv(
     return path
 
 
+def _rows_for_export(
+    records: Iterable[ExportRecord], headers: Sequence[str] | None
+) -> tuple[list[str], Iterator[list[object]]]:
+    iterator = iter(records)
+    first = next(iterator, None)
+    if iterator is records and first is not None:
+        records = chain([first], iterator)
+    if isinstance(first, Business):
+        businesses = cast(Iterable[Business], records)
+        if headers is None or tuple(headers) == BUSINESS_EXPORT_FIELDS:
+            # to_row() already follows the export order, so no dict is built
+            # and no per-header lookup is needed.
+            return list(BUSINESS_EXPORT_FIELDS), (
+                [_coerce(value) for value in business.to_row()] for business in businesses
+            )
+        records = (business.to_dict() for business in businesses)
+
+    mappings = cast(Iterable[Record], records)
+    if headers is None:
+        if iter(mappings) is mappings:
+            mappings = list(mappings)
+        headers = collect_headers(mappings)
+
+    headers, rows = flatten_records(mappings, headers=headers)
+    first_row = next(rows, None)
+    if first_row is None:
+        raise ValueError("No records supplied for export")
+    return headers, chain([first_row], rows)
+
+
+def _iter_discovered_rows(
+    records: Iterable[Record], headers: List[str]
+) -> Iterator[list[object]]:
+    seen: Dict[str, object] = {}
+    for record in records:
+        seen.update(record)
+        if len(seen) != len(headers):
+            headers.extend(islice(seen, len(headers), None))
+        yield _flatten_row(record, headers)
+
+
+def _flatten_row(record: Record, headers: Sequence[str]) -> list[object]:
+    return [_coerce(record.get(header)) for header in headers]
+
+
 def _coerce(value: object) -> object:
+    # JSON-parsed records only contain a handful of exact types, so a single
+    # dict lookup on type(value) avoids walking the isinstance ladder per cell.
+    coercer = _COERCERS.get(type(value))
+    if coercer is not None:
+        return coercer(value)
+    return _coerce_fallback(value)
+
+
+def _coerce_fallback(value: object) -> object:
     if value is None:
         return ""
     if isinstance(value, (list, tuple, set)):
-        return ", ".join(str(item) for item in value)
+        return _join(value)
     if isinstance(value, Mapping):
-        return json.dumps(value, ensure_ascii=False)
+        return _dump(value)
     return value
 
 
-def _auto_size_columns(worksheet, headers: Sequence[str], rows: Sequence[Sequence[object]]) -> None:
+def _identity(value: object) -> object:
+    return value
+
+
+def _blank(value: None) -> str:
+    return ""
+
+
+def _join(value: Iterable[object]) -> str:
+    return ", ".join(str(item) for item in value)
+
+
+def _dump(value: Mapping[str, object]) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+_COERCERS: Dict[type, Callable[[Any], object]] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _blank,
+    list: _join,
+    tuple: _join,
+    set: _join,
+    dict: _dump,
+}
+
+
+def _write_xlsxwriter(
+    path: Path, sheet_name: str, headers: Sequence[str], rows: Iterable[Sequence[object]]
+) -> None:
+    # constant_memory flushes each row to disk as soon as the next one starts,
+    # so column widths are tracked while writing instead of re-scanning rows.
+    workbook = xlsxwriter.Workbook(str(path), {"constant_memory": True, "strings_to_urls": False})
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, headers)
     widths = [len(str(header)) for header in headers]
-    for row in rows:
+    for row_idx, row in enumerate(rows, start=1):
+        worksheet.write_row(row_idx, 0, row)
         for idx, cell in enumerate(row):
-            widths[idx] = max(widths[idx], len(str(cell)))
+            # Most flattened cells are already strings; skip the str() copy.
+            width = len(cell) if type(cell) is str else len(str(cell))
+            if width > widths[idx]:
+                widths[idx] = width
+
+    for idx, width in enumerate(widths):
+        worksheet.set_column(idx, idx, min(width + 2, 60))
+    workbook.close()
 
-    for idx, width in enumerate(widths, start=1):
-        column_letter = get_column_letter(idx)
-        worksheet.column_dimensions[column_letter].width = min(width + 2, 60)
+
+def _write_openpyxl(
+    path: Path, sheet_name: str, headers: Sequence[str], rows: Iterable[Sequence[object]]
+) -> None:
+    # Write-only mode keeps memory flat but cannot resize columns after rows
+    # have been appended, so the fallback leaves default widths in place.
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(sheet_name)
+    worksheet.append(headers)
+    for row in rows:
+        worksheet.append(row)
+    workbook.save(path)
 
 
-__all__ = ["export_to_excel", "export_to_csv", "flatten_records"]
+__all__ = ["export_to_excel", "export_to_csv", "flatten_records", "collect_headers"]
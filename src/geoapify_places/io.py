@@ -0,0 +1,66 @@
+"""Streaming readers for sweep JSON output."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Tuple
+
+from . import _json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore[assignment]
+
+
+def iter_records(path: str | Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records stored in a sweep JSON file one at a time.
+
+    When ijson is installed the list is streamed so only one record is held
+    in memory at once; otherwise the whole file is parsed up front.
+    """
+
+    file_path = Path(path)
+    with file_path.open("rb") as handle:
+        if _first_byte(handle) != b"[":
+            raise ValueError(f"{file_path} must contain a JSON list of records")
+        handle.seek(0)
+        if ijson is None:
+            yield from _json.loads(handle.read())
+        else:
+            yield from ijson.items(handle, "item", use_float=True)
+
+
+def scan_records(path: str | Path) -> Tuple[Iterable[Dict[str, Any]], List[str], int]:
+    """
+    Return the records of a sweep JSON file with their column headers and count.
+
+    With ijson the file is streamed once to collect headers and the count,
+    and the returned records stream it again, so memory stays flat. Without
+    ijson every pass would parse the whole file, so it is parsed once and the
+    returned records are that list.
+    """
+
+    seen: Dict[str, object] = {}
+    if ijson is None:
+        records = list(iter_records(path))
+        for record in records:
+            seen.update(record)
+        return records, list(seen), len(records)
+
+    count = 0
+    for count, record in enumerate(iter_records(path), start=1):
+        seen.update(record)
+    return iter_records(path), list(seen), count
+
+
+def _first_byte(handle: BinaryIO) -> bytes:
+    while chunk := handle.read(64):
+        stripped = chunk.lstrip()
+        if stripped:
+            return stripped[:1]
+    return b""
+
+
+__all__ = ["iter_records", "scan_records"]
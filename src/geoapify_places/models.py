@@ -2,11 +2,42 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Mapping, Sequence, Tuple
+import sys
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Sequence, Tuple
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-@dataclass(frozen=True)
+# Geoapify returns a small vocabulary of category lists, so identical tuples
+# are shared across businesses instead of allocated per feature.
+_category_interner: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+# Column order of Business.to_dict and Business.to_row; the exporters use it
+# as the default headers for Business items. Kept at module level because
+# mypyc rejects class variables on the slotted dataclass.
+BUSINESS_EXPORT_FIELDS: Tuple[str, ...] = (
+    "place_id",
+    "name",
+    "latitude",
+    "longitude",
+    "categories",
+    "address_line1",
+    "address_line2",
+    "city",
+    "state",
+    "postcode",
+    "country",
+    "formatted_address",
+    "website",
+    "phone",
+    "distance_meters",
+)
+
+_FLOAT_COLUMNS = frozenset({"latitude", "longitude", "distance_meters"})
+
+
+@dataclass(frozen=True, slots=True)
 class Business:
     """Represents a convenient slice of the Geoapify Places response."""
 
@@ -51,85 +82,208 @@ class Business:
             data["raw"] = self.raw
         return data
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Rebuild through __init__ so pickles also load into the mypyc-compiled
+        # class, where the dataclass __setstate__ trips over frozen fields.
+        return (Business, (*self.to_row(), self.raw))
+
+    def to_row(self) -> Tuple[Any, ...]:
+        """Return the exported values as a tuple ordered like ``BUSINESS_EXPORT_FIELDS``."""
+
+        return (
+            self.place_id,
+            self.name,
+            self.latitude,
+            self.longitude,
+            self.categories,
+            self.address_line1,
+            self.address_line2,
+            self.city,
+            self.state,
+            self.postcode,
+            self.country,
+            self.formatted_address,
+            self.website,
+            self.phone,
+            self.distance_meters,
+        )
+
 
 def business_from_feature(feature: Mapping[str, Any]) -> Business:
     """Convert a single GeoJSON feature into a :class:`Business`."""
 
-    props = dict(feature.get("properties") or {})
+    props = feature.get("properties") or {}
     geometry = feature.get("geometry") or {}
     lon, lat = _extract_coordinates(props, geometry)
+    return _build_business(feature, props, lon, lat)
 
-    place_id = str(
-        props.get("place_id")
-        or props.get("datasource", {}).get("raw", {}).get("id")
-        or props.get("datasource", {}).get("raw", {}).get("osm_id")
-        or props.get("name")
-        or f"feature-{hash(str(feature))}"
-    )
 
-    categories = _normalize_categories(props)
+def businesses_from_feature_collection(payload: Mapping[str, Any]) -> List[Business]:
+    """Parse a Geoapify Places response payload into :class:`Business` items."""
+
+    return [
+        business
+        for feature in payload.get("features") or ()
+        if (business := _parse_feature(feature)) is not None
+    ]
 
+
+def iter_businesses_from_feature_collection(payload: Mapping[str, Any]) -> Iterator[Business]:
+    """Lazily yield :class:`Business` items from a Places payload, one per valid feature."""
+
+    for feature in payload.get("features") or ():
+        if (business := _parse_feature(feature)) is not None:
+            yield business
+
+
+def _parse_feature(feature: Any) -> Business | None:
+    """Parse one feature, returning ``None`` instead of raising when it is unusable."""
+
+    try:
+        props = feature.get("properties") or {}
+        # Coordinateless POIs are common, so they are rejected without raising;
+        # the coordinates are converted once and reused for the Business.
+        coordinates = _coordinates_or_none(props, feature.get("geometry") or {})
+        if coordinates is None:
+            return None
+        lon, lat = coordinates
+        return _build_business(feature, props, lon, lat)
+    except Exception:
+        # Skip malformed features but keep the raw payload for debugging later.
+        return None
+
+
+def _build_business(
+    feature: Mapping[str, Any], props: Mapping[str, Any], lon: float, lat: float
+) -> Business:
+    get = props.get
     return Business(
-        place_id=place_id,
-        name=props.get("name"),
+        place_id=_resolve_place_id(props, lon, lat),
+        name=get("name"),
         latitude=lat,
         longitude=lon,
-        categories=categories,
-        address_line1=props.get("address_line1"),
-        address_line2=props.get("address_line2"),
-        city=props.get("city"),
-        state=props.get("state"),
-        postcode=props.get("postcode"),
-        country=props.get("country"),
-        formatted_address=props.get("formatted"),
-        website=props.get("website"),
-        phone=props.get("phone"),
-        distance_meters=_normalize_float(props.get("distance")),
+        categories=_normalize_categories(props),
+        address_line1=get("address_line1"),
+        address_line2=get("address_line2"),
+        city=_intern(get("city")),
+        state=_intern(get("state")),
+        postcode=get("postcode"),
+        country=_intern(get("country")),
+        formatted_address=get("formatted"),
+        website=get("website"),
+        phone=get("phone"),
+        distance_meters=_normalize_float(get("distance")),
         raw=feature,
     )
 
 
-def businesses_from_feature_collection(payload: Mapping[str, Any]) -> List[Business]:
-    """Parse a Geoapify Places response payload into :class:`Business` items."""
+def businesses_dataframe_from_feature_collection(payload: Mapping[str, Any]) -> pd.DataFrame:
+    """
+    Parse a Geoapify Places payload into a pandas DataFrame in one batch.
+
+    Columns match the :class:`Business` fields (including ``raw``) and rows
+    are exactly those of :func:`businesses_from_feature_collection`; building
+    the frame from row tuples skips the intermediate dataclass dicts.
+    Missing distances are ``NaN`` rather than ``None``.
+    """
+
+    import pandas as pd
+
+    columns = [business_field.name for business_field in fields(Business)]
+    rows = [
+        (*business.to_row(), business.raw)
+        for business in iter_businesses_from_feature_collection(payload)
+    ]
+    values = list(zip(*rows)) if rows else [()] * len(columns)
+    # Text columns stay object dtype so missing values remain ``None``.
+    return pd.DataFrame(
+        {
+            name: pd.Series(column, dtype=float if name in _FLOAT_COLUMNS else object)
+            for name, column in zip(columns, values)
+        },
+        columns=columns,
+    )
+
 
-    features = payload.get("features") or []
-    businesses = []
-    for feature in features:
-        try:
-            businesses.append(business_from_feature(feature))
-        except Exception:
-            # Skip malformed features but keep the raw payload for debugging later.
-            continue
-    return businesses
+def _resolve_place_id(props: Mapping[str, Any], lon: float, lat: float) -> str:
+    """Pick the most stable identifier available, cheapest lookups first."""
+
+    place_id = props.get("place_id")
+    if not place_id:
+        datasource = props.get("datasource")
+        raw = datasource.get("raw") if isinstance(datasource, Mapping) else None
+        if isinstance(raw, Mapping):
+            place_id = raw.get("id") or raw.get("osm_id")
+    if not place_id:
+        place_id = props.get("name")
+    if not place_id:
+        return _fallback_place_id(lon, lat)
+    return str(place_id)
+
+
+def _fallback_place_id(lon: float, lat: float) -> str:
+    # Nameless features without ids are keyed by position; hashing a float
+    # tuple is deterministic across runs, unlike hashing the feature's repr.
+    return f"feature-{hash((lon, lat))}"
 
 
 def _extract_coordinates(
     props: Mapping[str, Any], geometry: Mapping[str, Any]
 ) -> Tuple[float, float]:
+    coordinates = _coordinates_or_none(props, geometry)
+    if coordinates is None:
+        raise ValueError("Feature missing coordinates")
+    return coordinates
+
+
+def _coordinates_or_none(
+    props: Mapping[str, Any], geometry: Any
+) -> Tuple[float, float] | None:
+    """Return ``(lon, lat)`` from the properties, else the geometry, else ``None``."""
+
     lon = _normalize_float(props.get("lon"))
     lat = _normalize_float(props.get("lat"))
-    coords = geometry.get("coordinates")
 
-    if lat is None or lon is None:
-        if isinstance(coords, (list, tuple)) and len(coords) >= 2:
-            lon = _normalize_float(coords[0])
-            lat = _normalize_float(coords[1])
+    # Only look at the geometry when the properties lack a usable pair; both
+    # values then come from the geometry.
+    if (
+        (lat is None or lon is None)
+        and _is_mapping(geometry)
+        and isinstance(coords := geometry.get("coordinates"), (list, tuple))
+        and len(coords) >= 2
+    ):
+        lon = _normalize_float(coords[0])
+        lat = _normalize_float(coords[1])
 
     if lat is None or lon is None:
-        raise ValueError("Feature missing coordinates")
-
+        return None
     return lon, lat
 
 
+def _is_mapping(value: Any) -> bool:
+    # Parsed JSON is plain dicts; skip the slower ABC check for them.
+    return type(value) is dict or isinstance(value, Mapping)
+
+
 def _normalize_categories(props: Mapping[str, Any]) -> Tuple[str, ...]:
     categories: Sequence[str] | None = props.get("categories")
     if not categories and props.get("category"):
         categories = [props["category"]]
 
-    return tuple(str(category) for category in categories or ())
+    key = tuple(str(category) for category in categories or ())
+    return _category_interner.setdefault(key, key)
+
+
+def _intern(value: Any) -> Any:
+    # City/state/country repeat heavily across a sweep; share one string each.
+    return sys.intern(value) if type(value) is str else value
 
 
 def _normalize_float(value: Any) -> float | None:
+    # Geoapify coordinates are almost always floats already; everything else
+    # goes through float(), whose try block only costs anything when it raises.
+    if type(value) is float:
+        return value
     if value is None:
         return None
     try:
@@ -138,4 +292,11 @@ def _normalize_float(value: Any) -> float | None:
         return None
 
 
-__all__ = ["Business", "business_from_feature", "businesses_from_feature_collection"]
+__all__ = [
+    "BUSINESS_EXPORT_FIELDS",
+    "Business",
+    "business_from_feature",
+    "businesses_from_feature_collection",
+    "businesses_dataframe_from_feature_collection",
+    "iter_businesses_from_feature_collection",
+]
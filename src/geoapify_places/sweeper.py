@@ -2,14 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
-from dataclasses import dataclass
+import hashlib
+import os
+import pickle
+from array import array
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Iterable, List, Mapping, MutableMapping, Sequence
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple, overload
 
-from .client import GeoapifyPlacesClient
+from .client import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_POOL_SIZE,
+    GeoapifyPlacesClient,
+    PlacesQuery,
+    _RateLimiter,
+)
+from .exceptions import GeoapifyClientValidationError
 from .models import Business
 
+# Part of every disk-cache key: pickled businesses are rebuilt positionally,
+# so entries written for a different Business layout must never be reused.
+# Bump the version when the pickled format changes in any other way.
+_CACHE_FORMAT = (1, *(business_field.name for business_field in fields(Business)))
+
 
 @dataclass(frozen=True)
 class SweepPoint:
@@ -21,73 +38,394 @@ class SweepPoint:
     label: str | None = None
 
 
+class SweepGrid(Sequence[SweepPoint]):
+    """
+    Columnar sweep points: one typed array per column instead of one object per point.
+
+    Behaves as a read-only sequence of :class:`SweepPoint` (rows are built on
+    access), while :func:`sweep_businesses` reads the columns directly.
+    """
+
+    __slots__ = ("latitudes", "longitudes", "radii_m", "labels")
+
+    def __init__(
+        self,
+        latitudes: Iterable[float],
+        longitudes: Iterable[float],
+        radii_m: Iterable[int],
+        labels: Iterable[str | None] | None = None,
+    ) -> None:
+        self.latitudes = array("d", latitudes)
+        self.longitudes = array("d", longitudes)
+        # Truncate like the request builder does, so float radii are accepted.
+        self.radii_m = array("q", (int(radius) for radius in radii_m))
+        count = len(self.latitudes)
+        self.labels: List[str | None] = [None] * count if labels is None else list(labels)
+        if not len(self.longitudes) == len(self.radii_m) == len(self.labels) == count:
+            raise ValueError("SweepGrid columns must all have the same length")
+
+    @classmethod
+    def from_points(cls, points: Iterable[SweepPoint]) -> SweepGrid:
+        points = list(points)
+        return cls(
+            [point.latitude for point in points],
+            [point.longitude for point in points],
+            [point.radius_m for point in points],
+            [point.label for point in points],
+        )
+
+    @classmethod
+    def from_csv(cls, path: str | Path) -> SweepGrid:
+        """Read a sweep CSV (same format as :func:`read_sweep_points`) into columns."""
+
+        return cls(*_read_sweep_columns(path))
+
+    def __len__(self) -> int:
+        return len(self.latitudes)
+
+    @overload
+    def __getitem__(self, index: int) -> SweepPoint: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> SweepGrid: ...
+
+    def __getitem__(self, index: int | slice) -> SweepPoint | SweepGrid:
+        if isinstance(index, slice):
+            return SweepGrid(
+                self.latitudes[index],
+                self.longitudes[index],
+                self.radii_m[index],
+                self.labels[index],
+            )
+        return SweepPoint(
+            latitude=self.latitudes[index],
+            longitude=self.longitudes[index],
+            radius_m=self.radii_m[index],
+            label=self.labels[index],
+        )
+
+    def __iter__(self) -> Iterator[SweepPoint]:
+        for latitude, longitude, radius, label in zip(
+            self.latitudes, self.longitudes, self.radii_m, self.labels
+        ):
+            yield SweepPoint(latitude=latitude, longitude=longitude, radius_m=radius, label=label)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SweepGrid):
+            return NotImplemented
+        return (
+            self.latitudes == other.latitudes
+            and self.longitudes == other.longitudes
+            and self.radii_m == other.radii_m
+            and self.labels == other.labels
+        )
+
+    def __repr__(self) -> str:
+        return f"SweepGrid(<{len(self)} points>)"
+
+
 def read_sweep_points(path: str | Path) -> List[SweepPoint]:
     """
     Parse a CSV file containing latitude/longitude/radius entries.
 
     Required columns: latitude, longitude, radius_m.
     Optional columns: label (human-friendly name for the point).
+
+    Uses pandas' typed C parser when pandas is installed and falls back to
+    the standard library csv module otherwise. See :meth:`SweepGrid.from_csv`
+    for a columnar variant.
     """
 
+    return [
+        SweepPoint(latitude=latitude, longitude=longitude, radius_m=radius, label=label)
+        for latitude, longitude, radius, label in zip(*_read_sweep_columns(path))
+    ]
+
+
+_REQUIRED_SWEEP_COLUMNS = {"latitude", "longitude", "radius_m"}
+_SWEEP_COLUMN_DTYPES = {
+    "latitude": "float64",
+    "longitude": "float64",
+    "radius_m": "float64",
+    "label": "string",
+}
+
+SweepColumns = Tuple[List[float], List[float], List[int], List[str | None]]
+
+
+def _read_sweep_columns(path: str | Path) -> SweepColumns:
     file_path = Path(path)
     if not file_path.exists():
         raise FileNotFoundError(f"Sweep file not found: {file_path}")
 
-    points: List[SweepPoint] = []
+    try:
+        import pandas as pd
+    except ImportError:
+        columns = _read_sweep_columns_csv(file_path)
+    else:
+        columns = _read_sweep_columns_pandas(file_path, pd)
+
+    if not columns[0]:
+        raise ValueError(f"Sweep file {file_path} did not contain any points")
+
+    return columns
+
+
+def _read_sweep_columns_pandas(file_path: Path, pd) -> SweepColumns:
+    try:
+        frame = pd.read_csv(
+            file_path,
+            usecols=lambda column: column in _SWEEP_COLUMN_DTYPES,
+            dtype=_SWEEP_COLUMN_DTYPES,
+            keep_default_na=False,
+            encoding="utf-8",
+        )
+    except ValueError as exc:
+        raise ValueError(f"Invalid sweep file {file_path}: {exc}") from exc
+
+    columns = set(frame.columns)
+    if not _REQUIRED_SWEEP_COLUMNS.issubset(columns):
+        raise ValueError(
+            f"Sweep file {file_path} missing columns: {_REQUIRED_SWEEP_COLUMNS - columns}"
+        )
+
+    numeric = frame[sorted(_REQUIRED_SWEEP_COLUMNS)]
+    if numeric.isna().to_numpy().any():
+        raise ValueError(f"Invalid sweep file {file_path}: missing coordinate values")
+
+    if "label" in columns:
+        stripped = frame["label"].fillna("").str.strip().tolist()
+        labels = [label or None for label in stripped]
+    else:
+        labels = [None] * len(frame)
+
+    return (
+        frame["latitude"].tolist(),
+        frame["longitude"].tolist(),
+        frame["radius_m"].astype("int64").tolist(),
+        labels,
+    )
+
+
+def _read_sweep_columns_csv(file_path: Path) -> SweepColumns:
+    latitudes: List[float] = []
+    longitudes: List[float] = []
+    radii: List[int] = []
+    labels: List[str | None] = []
     with file_path.open("r", encoding="utf-8", newline="") as handle:
         reader = csv.DictReader(handle)
         fieldnames = set(reader.fieldnames or [])
-        required = {"latitude", "longitude", "radius_m"}
-        if not required.issubset(fieldnames):
+        if not _REQUIRED_SWEEP_COLUMNS.issubset(fieldnames):
             raise ValueError(
-                f"Sweep file {file_path} missing columns: {required - fieldnames}"
+                f"Sweep file {file_path} missing columns: {_REQUIRED_SWEEP_COLUMNS - fieldnames}"
             )
+        has_label = "label" in fieldnames
         for row in reader:
             try:
-                label = row.get("label") if "label" in fieldnames else None
-                points.append(
-                    SweepPoint(
-                        latitude=float(row["latitude"]),
-                        longitude=float(row["longitude"]),
-                        radius_m=int(float(row["radius_m"])),
-                        label=label.strip() if label else None,
-                    )
-                )
+                # Convert the whole row before appending so columns stay aligned.
+                latitude = float(row["latitude"])
+                longitude = float(row["longitude"])
+                radius = int(float(row["radius_m"]))
             except (TypeError, ValueError) as exc:
                 raise ValueError(f"Invalid sweep row: {row}") from exc
+            # DictReader fills short rows with None, so indexing is safe.
+            label = row["label"] if has_label else None
+            latitudes.append(latitude)
+            longitudes.append(longitude)
+            radii.append(radius)
+            labels.append((label.strip() or None) if label else None)
+    return latitudes, longitudes, radii, labels
 
-    if not points:
-        raise ValueError(f"Sweep file {file_path} did not contain any points")
 
-    return points
+def sweep_businesses(
+    client: GeoapifyPlacesClient,
+    points: Sequence[SweepPoint] | SweepGrid,
+    *,
+    categories: Sequence[str] | None = None,
+    limit: int = 100,
+    language: str | None = None,
+    extra_params: Mapping[str, object] | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    rate_limit_per_sec: float | None = None,
+    cache_dir: str | Path | None = None,
+) -> List[Business]:
+    """
+    Run multiple Geoapify queries and merge the unique businesses.
 
+    Queries are issued concurrently through ``client.search_many`` (optionally
+    throttled to ``rate_limit_per_sec``); results are merged in point order,
+    so the first point that returns a place wins. Points that exactly repeat
+    an earlier point's coordinates and radius are skipped, since their
+    results could not add new places.
 
-def sweep_businesses(
+    Pass ``cache_dir`` to pickle each response to disk and reuse it on later
+    runs with the same query parameters.
+    """
+
+    queries = _unique_queries(points, categories=categories, limit=limit, language=language)
+
+    def search(batch: Iterable[PlacesQuery]) -> Iterator[List[Business]]:
+        return client.search_many(
+            batch,
+            max_workers=max_workers,
+            extra_params=extra_params,
+            rate_limit_per_sec=rate_limit_per_sec,
+        )
+
+    if cache_dir is None:
+        return _merge_unique(search(queries))
+    return _merge_unique(_search_with_cache(search, queries, Path(cache_dir), extra_params))
+
+
+async def asweep_businesses(
     client: GeoapifyPlacesClient,
-    points: Sequence[SweepPoint],
+    points: Sequence[SweepPoint] | SweepGrid,
     *,
     categories: Sequence[str] | None = None,
     limit: int = 100,
     language: str | None = None,
     extra_params: Mapping[str, object] | None = None,
+    max_concurrency: int = DEFAULT_POOL_SIZE,
+    rate_limit_per_sec: float | None = None,
 ) -> List[Business]:
-    """Run multiple Geoapify queries and merge the unique businesses."""
-
-    dedup: MutableMapping[str, Business] = {}
-    for point in points:
-        businesses = client.search_businesses(
-            latitude=point.latitude,
-            longitude=point.longitude,
-            radius_m=point.radius_m,
+    """
+    Async variant of :func:`sweep_businesses` using ``client.asearch_businesses``.
+
+    At most ``max_concurrency`` requests are in flight at once and
+    ``rate_limit_per_sec`` optionally spaces out request starts; repeated
+    points are skipped and results are merged in point order just like the
+    threaded sweep.
+    """
+
+    if max_concurrency <= 0:
+        raise GeoapifyClientValidationError("max_concurrency must be positive")
+    semaphore = asyncio.Semaphore(max_concurrency)
+    throttle = _RateLimiter(rate_limit_per_sec) if rate_limit_per_sec else None
+
+    async def fetch(query: PlacesQuery) -> List[Business]:
+        async with semaphore:
+            if throttle is not None:
+                delay = throttle.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            return await client.asearch_businesses(
+                latitude=query.latitude,
+                longitude=query.longitude,
+                radius_m=query.radius_m,
+                categories=query.categories,
+                limit=query.limit,
+                language=query.language,
+                extra_params=extra_params,
+            )
+
+    queries = _unique_queries(points, categories=categories, limit=limit, language=language)
+    results = await asyncio.gather(*(fetch(query) for query in queries))
+    return _merge_unique(results)
+
+
+def _unique_queries(
+    points: Iterable[SweepPoint] | SweepGrid,
+    *,
+    categories: Sequence[str] | None,
+    limit: int,
+    language: str | None,
+) -> Iterator[PlacesQuery]:
+    if isinstance(points, SweepGrid):
+        # Read the columns directly instead of materializing SweepPoint rows.
+        rows: Iterable[Tuple[float, float, int]] = zip(
+            points.latitudes, points.longitudes, points.radii_m
+        )
+    else:
+        rows = ((point.latitude, point.longitude, point.radius_m) for point in points)
+
+    seen: set[Tuple[float, float, int]] = set()
+    for latitude, longitude, radius in rows:
+        key = (latitude, longitude, radius)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield PlacesQuery(
+            latitude=latitude,
+            longitude=longitude,
+            radius_m=radius,
             categories=categories,
             limit=limit,
             language=language,
-            extra_params=extra_params,
         )
-        for business in businesses:
-            dedup.setdefault(business.place_id, business)
 
-    return list(dedup.values())
+
+def _search_with_cache(
+    search: Callable[[Iterable[PlacesQuery]], Iterator[List[Business]]],
+    queries: Iterable[PlacesQuery],
+    cache_dir: Path,
+    extra_params: Mapping[str, object] | None,
+) -> List[List[Business]]:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    queries = list(queries)
+    paths = [cache_dir / f"{_cache_key(query, extra_params)}.pkl" for query in queries]
+    results: Dict[int, List[Business]] = {}
+    for index, path in enumerate(paths):
+        cached = _load_cached(path)
+        if cached is not None:
+            results[index] = cached
+    missing = [index for index in range(len(queries)) if index not in results]
+
+    for index, businesses in zip(missing, search(queries[index] for index in missing)):
+        _store_cached(paths[index], businesses)
+        results[index] = businesses
+    return [results[index] for index in range(len(queries))]
+
+
+def _cache_key(query: PlacesQuery, extra_params: Mapping[str, object] | None) -> str:
+    key = (
+        _CACHE_FORMAT,
+        query.latitude,
+        query.longitude,
+        query.radius_m,
+        tuple(query.categories or ()),
+        query.limit,
+        query.language,
+        tuple(sorted((str(name), str(value)) for name, value in (extra_params or {}).items())),
+    )
+    return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+
+
+def _load_cached(path: Path) -> List[Business] | None:
+    try:
+        with path.open("rb") as handle:
+            return pickle.load(handle)
+    except FileNotFoundError:
+        return None
+    except (pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError):
+        # Unreadable entries are treated as misses and rewritten after the fetch.
+        return None
+
+
+def _store_cached(path: Path, businesses: List[Business]) -> None:
+    # Write then rename so an interrupted sweep never leaves a truncated entry.
+    temp_path = path.with_suffix(".tmp")
+    with temp_path.open("wb") as handle:
+        pickle.dump(businesses, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+
+def _merge_unique(results: Iterable[Iterable[Business]]) -> List[Business]:
+    seen: set[str] = set()
+    unique: List[Business] = []
+    for businesses in results:
+        for business in businesses:
+            place_id = business.place_id
+            if place_id in seen:
+                continue
+            seen.add(place_id)
+            unique.append(business)
+    return unique
 
 
-__all__ = ["SweepPoint", "read_sweep_points", "sweep_businesses"]
+__all__ = [
+    "SweepGrid",
+    "SweepPoint",
+    "read_sweep_points",
+    "sweep_businesses",
+    "asweep_businesses",
+]
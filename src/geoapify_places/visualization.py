@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Mapping, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Iterable, List, Mapping, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 def collect_coordinates(
-    records: Sequence[Mapping[str, object]],
+    records: Iterable[Mapping[str, object]],
     *,
     lat_key: str = "latitude",
     lon_key: str = "longitude",
@@ -21,15 +24,76 @@ def collect_coordinates(
 
     coordinates: List[Tuple[float, float]] = []
     for record in records:
-        lat = _to_float(record.get(lat_key))
-        lon = _to_float(record.get(lon_key))
-        if lat is None or lon is None:
-            continue
-        coordinates.append((lat, lon))
+        pair = record_coordinates(record, lat_key=lat_key, lon_key=lon_key)
+        if pair is not None:
+            coordinates.append(pair)
     return coordinates
 
 
-def _to_float(value: object) -> float | None:
+def record_coordinates(
+    record: Mapping[str, object],
+    *,
+    lat_key: str = "latitude",
+    lon_key: str = "longitude",
+) -> Tuple[float, float] | None:
+    """Return the `(lat, lon)` pair for a single record, or ``None`` if invalid."""
+
+    lat = _to_float(record.get(lat_key))
+    lon = _to_float(record.get(lon_key))
+    if lat is None or lon is None:
+        return None
+    return lat, lon
+
+
+def collect_coordinates_array(
+    records: Iterable[Mapping[str, object]] | Any,
+    *,
+    lat_key: str = "latitude",
+    lon_key: str = "longitude",
+) -> np.ndarray:
+    """
+    Vectorized variant of :func:`collect_coordinates` returning an ``(N, 2)`` array.
+
+    Accepts JSON-like records or a pandas DataFrame. Values are coerced to
+    float in bulk (via ``pandas.to_numeric`` when pandas is installed) and
+    rows with missing, invalid or non-finite coordinates are dropped.
+    """
+
+    import numpy as np
+
+    if hasattr(records, "columns"):
+        frame: Any = records
+        lats = _to_float_array(frame[lat_key].to_numpy())
+        lons = _to_float_array(frame[lon_key].to_numpy())
+    else:
+        if not isinstance(records, Sequence):
+            records = list(records)
+        count = len(records)
+        lats = _to_float_array(
+            np.fromiter((record.get(lat_key) for record in records), dtype=object, count=count)
+        )
+        lons = _to_float_array(
+            np.fromiter((record.get(lon_key) for record in records), dtype=object, count=count)
+        )
+
+    mask = np.isfinite(lats) & np.isfinite(lons)
+    return np.column_stack((lats[mask], lons[mask]))
+
+
+def _to_float_array(values: np.ndarray) -> np.ndarray:
+    import numpy as np
+
+    try:
+        import pandas as pd
+    except ImportError:
+        return np.array(
+            [np.nan if (number := _to_float(value)) is None else number for value in values],
+            dtype=np.float64,
+        )
+    return np.asarray(pd.to_numeric(values, errors="coerce"), dtype=np.float64)
+
+
+def _to_float(value: Any) -> float | None:
     if value is None:
         return None
     try:
@@ -38,5 +102,5 @@ def _to_float(value: object) -> float | None:
         return None
 
 
-__all__ = ["collect_coordinates"]
+__all__ = ["collect_coordinates", "collect_coordinates_array", "record_coordinates"]
 
@@ -1,10 +1,14 @@
-from unittest.mock import Mock
+import json
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+import requests
 from requests import Response
 from requests.exceptions import RequestException
 
-from geoapify_places.client import GeoapifyPlacesClient
+from geoapify_places.client import GeoapifyPlacesClient, PlacesQuery
 from geoapify_places.config import GeoapifySettings
 from geoapify_places.exceptions import (
     GeoapifyApiError,
@@ -17,7 +21,7 @@ def _make_response(status: int = 200, payload: dict | None = None) -> Response:
     response = Mock(spec=Response)
     response.status_code = status
     response.text = "error"
-    response.json.return_value = payload or {"features": []}
+    response.content = json.dumps(payload or {"features": []}).encode("utf-8")
     return response
 
 
@@ -50,6 +54,8 @@ def test_search_businesses_returns_parsed_business(monkeypatch):
     args, kwargs = session.get.call_args
     assert kwargs["params"]["apiKey"] == "demo-key"
     assert kwargs["params"]["filter"] == "circle:20,10,500"
+    assert kwargs["params"]["bias"] == "proximity:20,10"
+    assert kwargs["params"]["categories"] == "commercial"
 
 
 def test_search_businesses_validates_radius():
@@ -63,18 +69,176 @@ def test_search_businesses_raises_for_http_error():
     settings = GeoapifySettings(api_key="demo-key")
     session = Mock()
     session.get.return_value = _make_response(status=500, payload={"message": "fail"})
+    client = GeoapifyPlacesClient(settings=settings, session=session, max_retries=0)
+
+    with pytest.raises(GeoapifyApiError) as excinfo:
+        client.search_businesses(latitude=0, longitude=0, radius_m=100)
+    assert excinfo.value.message == "fail"
+
+
+def test_search_businesses_retries_rate_limited_responses(monkeypatch):
+    delays = []
+    monkeypatch.setattr("geoapify_places.client.time.sleep", delays.append)
+    settings = GeoapifySettings(api_key="demo-key")
+    session = Mock()
+    throttled = _make_response(status=429, payload={"message": "slow down"})
+    throttled.headers = {"Retry-After": "2"}
+    server_error = _make_response(status=503, payload={"message": "busy"})
+    server_error.headers = {}
+    session.get.side_effect = [throttled, server_error, _make_response()]
+    client = GeoapifyPlacesClient(settings=settings, session=session, backoff_factor=0.5)
+
+    assert client.search_businesses(latitude=0, longitude=0, radius_m=100) == []
+    assert delays == [2.0, 1.0]
+    assert session.get.call_count == 3
+
+
+def test_search_businesses_caps_retry_after(monkeypatch):
+    delays = []
+    monkeypatch.setattr("geoapify_places.client.time.sleep", delays.append)
+    settings = GeoapifySettings(api_key="demo-key")
+    session = Mock()
+    throttled = _make_response(status=429, payload={"message": "slow down"})
+    throttled.headers = {"Retry-After": "3600"}
+    session.get.side_effect = [throttled, _make_response()]
+    client = GeoapifyPlacesClient(settings=settings, session=session, max_backoff=5)
+
+    assert client.search_businesses(latitude=0, longitude=0, radius_m=100) == []
+    assert delays == [5]
+
+
+def test_search_businesses_retries_only_transient_network_errors(monkeypatch):
+    delays = []
+    monkeypatch.setattr("geoapify_places.client.time.sleep", delays.append)
+    settings = GeoapifySettings(api_key="demo-key")
+    session = Mock()
+    session.get.side_effect = [requests.exceptions.ConnectionError("reset"), _make_response()]
     client = GeoapifyPlacesClient(settings=settings, session=session)
+    assert client.search_businesses(latitude=0, longitude=0, radius_m=100) == []
+    assert len(delays) == 1
 
-    with pytest.raises(GeoapifyApiError):
+    session.get.side_effect = requests.exceptions.InvalidURL("bad url")
+    session.get.reset_mock()
+    with pytest.raises(GeoapifyRequestError):
         client.search_businesses(latitude=0, longitude=0, radius_m=100)
+    assert session.get.call_count == 1
+    assert len(delays) == 1
 
 
 def test_search_businesses_handles_network_errors():
     settings = GeoapifySettings(api_key="demo-key")
     session = Mock()
     session.get.side_effect = RequestException("boom")
-    client = GeoapifyPlacesClient(settings=settings, session=session)
+    client = GeoapifyPlacesClient(settings=settings, session=session, max_retries=0)
 
     with pytest.raises(GeoapifyRequestError):
         client.search_businesses(latitude=0, longitude=0, radius_m=100)
 
+
+
+def test_search_businesses_handles_httpx_network_errors():
+    httpx = pytest.importorskip("httpx")
+    settings = GeoapifySettings(api_key="demo-key")
+    session = Mock()
+    session.get.side_effect = httpx.ConnectError("boom")
+    client = GeoapifyPlacesClient(settings=settings, session=session, max_retries=0)
+
+    with pytest.raises(GeoapifyRequestError):
+        client.search_businesses(latitude=0, longitude=0, radius_m=100)
+
+
+def test_search_businesses_raises_for_invalid_json():
+    settings = GeoapifySettings(api_key="demo-key")
+    session = Mock()
+    response = _make_response()
+    response.content = b"not json"
+    session.get.return_value = response
+    client = GeoapifyPlacesClient(settings=settings, session=session)
+
+    with pytest.raises(GeoapifyApiError):
+        client.search_businesses(latitude=0, longitude=0, radius_m=100)
+
+
+def test_search_many_yields_results_in_query_order():
+    settings = GeoapifySettings(api_key="demo-key")
+    session = Mock()
+
+    def fake_get(url, params, timeout):
+        lon, lat, _ = params["filter"].removeprefix("circle:").split(",")
+        feature = {
+            "properties": {"place_id": f"{lat}:{lon}", "lat": lat, "lon": lon},
+            "geometry": {},
+        }
+        return _make_response(payload={"features": [feature]})
+
+    session.get.side_effect = fake_get
+    client = GeoapifyPlacesClient(settings=settings, session=session)
+    queries = [PlacesQuery(latitude=idx, longitude=-idx, radius_m=100) for idx in range(5)]
+
+    results = list(client.search_many(queries, max_workers=3))
+    assert [result[0].place_id for result in results] == [
+        f"{idx}:{-idx}" for idx in range(5)
+    ]
+
+
+def test_requests_fallback_uses_one_session_per_thread(monkeypatch):
+    monkeypatch.setattr("geoapify_places.client.httpx", None)
+    used = []
+
+    def fake_get(self, url, **kwargs):
+        used.append((threading.get_ident(), self))
+        return _make_response()
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    client = GeoapifyPlacesClient(settings=GeoapifySettings(api_key="demo-key"))
+    queries = [PlacesQuery(latitude=idx, longitude=-idx, radius_m=100) for idx in range(8)]
+
+    list(client.search_many(queries, max_workers=4))
+    client.search_businesses(latitude=1, longitude=1, radius_m=100)
+    sessions_by_thread = {}
+    for thread_id, session in used:
+        assert sessions_by_thread.setdefault(thread_id, session) is session
+    assert len({id(session) for session in sessions_by_thread.values()}) == len(sessions_by_thread) > 1
+
+
+def test_asearch_businesses_uses_async_session():
+    settings = GeoapifySettings(api_key="demo-key")
+    payload = {
+        "features": [
+            {"properties": {"place_id": "demo", "lat": 10, "lon": 20}, "geometry": {}}
+        ]
+    }
+    async_session = Mock()
+    async_session.get = AsyncMock(return_value=_make_response(payload=payload))
+    client = GeoapifyPlacesClient(
+        settings=settings, session=Mock(), async_session=async_session
+    )
+
+    businesses = asyncio.run(
+        client.asearch_businesses(latitude=10, longitude=20, radius_m=500)
+    )
+
+    assert [business.place_id for business in businesses] == ["demo"]
+    args, kwargs = async_session.get.call_args
+    assert kwargs["params"]["filter"] == "circle:20,10,500"
+
+
+def test_search_many_throttles_submissions(monkeypatch):
+    clock = {"now": 100.0}
+    delays = []
+
+    def fake_sleep(seconds):
+        delays.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr("geoapify_places.client.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr("geoapify_places.client.time.sleep", fake_sleep)
+    settings = GeoapifySettings(api_key="demo-key")
+    session = Mock()
+    session.get.return_value = _make_response()
+    client = GeoapifyPlacesClient(settings=settings, session=session)
+    queries = [PlacesQuery(latitude=0, longitude=0, radius_m=100) for _ in range(3)]
+
+    results = list(client.search_many(queries, max_workers=1, rate_limit_per_sec=4))
+    assert results == [[], [], []]
+    assert delays == [0.25, 0.25]
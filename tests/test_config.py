@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from geoapify_places import config
+from geoapify_places.config import API_KEY_ENV_VAR, load_settings
+
+
+def test_load_settings_reads_env_file_once(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv(API_KEY_ENV_VAR, raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text(f"# comment\n{API_KEY_ENV_VAR} = file-key \n", encoding="utf-8")
+    calls = []
+    original = config._parse_env_file
+    monkeypatch.setattr(
+        config, "_parse_env_file", lambda path: calls.append(path) or original(path)
+    )
+
+    assert load_settings(env_file).api_key == "file-key"
+    monkeypatch.delenv(API_KEY_ENV_VAR)
+    assert load_settings(env_file).api_key == "file-key"
+    assert len(calls) == 1
+
+
+def test_load_settings_prefers_existing_environment(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv(API_KEY_ENV_VAR, "shell-key")
+    env_file = tmp_path / ".env"
+    env_file.write_text(f"{API_KEY_ENV_VAR}=file-key\n", encoding="utf-8")
+
+    assert load_settings(env_file).api_key == "shell-key"
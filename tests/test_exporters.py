@@ -2,7 +2,13 @@ from pathlib import Path
 
 import pytest
 
-from geoapify_places.exporters import export_to_csv, export_to_excel, flatten_records
+from geoapify_places.exporters import (
+    collect_headers,
+    export_to_csv,
+    export_to_excel,
+    flatten_records,
+)
+from geoapify_places.models import BUSINESS_EXPORT_FIELDS, business_from_feature
 
 
 def test_flatten_records_handles_lists_and_dicts():
@@ -11,6 +17,7 @@ def test_flatten_records_handles_lists_and_dicts():
         {"place_id": "2", "city": "Raleigh"},
     ]
     headers, rows = flatten_records(records)
+    rows = list(rows)
     assert "place_id" in headers
     assert "categories" in headers
     assert rows[0][headers.index("categories")] == "a, b"
@@ -18,6 +25,23 @@ def test_flatten_records_handles_lists_and_dicts():
     assert isinstance(raw_value, str) and '"foo": "bar"' in raw_value
 
 
+def test_flatten_records_discovers_headers_while_streaming():
+    records = iter([{"place_id": "1"}, {"place_id": "2", "city": "Raleigh"}])
+    headers, rows = flatten_records(records)
+    assert next(rows) == ["1"]
+    assert headers == ["place_id"]
+    assert next(rows) == ["2", "Raleigh"]
+    assert headers == ["place_id", "city"]
+
+
+def test_flatten_records_with_fixed_headers_ignores_other_keys():
+    records = [{"place_id": "1", "city": "Raleigh"}, {"name": "Shop"}]
+    assert collect_headers(records) == ["place_id", "city", "name"]
+    headers, rows = flatten_records(records, headers=["name", "place_id"])
+    assert headers == ["name", "place_id"]
+    assert list(rows) == [["", "1"], ["Shop", ""]]
+
+
 def test_export_to_excel_writes_file(tmp_path: Path):
     records = [
         {"place_id": "1", "name": "Business 1"},
@@ -45,6 +69,69 @@ def test_export_to_csv_writes_file(tmp_path: Path):
     assert output.exists()
 
 
+def test_export_to_csv_streams_with_fixed_headers(tmp_path: Path):
+    records = ({"place_id": str(idx), "categories": ["a", "b"]} for idx in range(2))
+    output = tmp_path / "businesses.csv"
+    export_to_csv(records, output, headers=["place_id", "categories"])
+    assert output.read_text(encoding="utf-8").splitlines() == [
+        "place_id,categories",
+        '0,"a, b"',
+        '1,"a, b"',
+    ]
+
+
+def test_export_to_csv_writes_business_rows(tmp_path: Path):
+    businesses = [
+        business_from_feature(
+            {
+                "properties": {
+                    "place_id": str(idx),
+                    "lat": 35.0,
+                    "lon": -80.0,
+                    "categories": ["a", "b"],
+                }
+            }
+        )
+        for idx in range(2)
+    ]
+    rows_path = export_to_csv(iter(businesses), tmp_path / "rows.csv")
+    dicts_path = export_to_csv(
+        [business.to_dict() for business in businesses], tmp_path / "dicts.csv"
+    )
+    lines = rows_path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == ",".join(BUSINESS_EXPORT_FIELDS)
+    assert lines[1].startswith('0,,35.0,-80.0,"a, b",')
+    assert lines == dicts_path.read_text(encoding="utf-8").splitlines()
+
+    subset_path = export_to_csv(
+        businesses, tmp_path / "subset.csv", headers=["place_id", "categories"]
+    )
+    assert subset_path.read_text(encoding="utf-8").splitlines()[1] == '0,"a, b"'
+
+
 def test_export_to_csv_requires_records():
     with pytest.raises(ValueError):
         export_to_csv([], "out.csv")
+
+
+def test_export_to_excel_accepts_generators(tmp_path: Path):
+    records = ({"place_id": str(idx)} for idx in range(3))
+    output = tmp_path / "businesses.xlsx"
+    assert export_to_excel(records, output) == output
+
+
+def test_export_to_excel_writes_headers_and_rows(tmp_path: Path):
+    from openpyxl import load_workbook
+
+    records = [
+        {"place_id": "1", "categories": ["a", "b"]},
+        {"place_id": "2", "city": "Raleigh"},
+    ]
+    output = tmp_path / "businesses.xlsx"
+    export_to_excel(records, output, sheet_name="NC")
+
+    worksheet = load_workbook(output)["NC"]
+    values = [list(row) for row in worksheet.iter_rows(values_only=True)]
+    assert values[0] == ["place_id", "categories", "city"]
+    assert values[1][:2] == ["1", "a, b"]
+    assert values[2][2] == "Raleigh"
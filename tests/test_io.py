@@ -0,0 +1,40 @@
+from pathlib import Path
+
+import pytest
+
+from geoapify_places.io import iter_records, scan_records
+
+
+def test_iter_records_streams_list_items(tmp_path: Path):
+    path = tmp_path / "businesses.json"
+    path.write_text(
+        '[{"place_id": "1", "latitude": 35.5}, {"place_id": "2", "latitude": 36}]',
+        encoding="utf-8",
+    )
+
+    records = list(iter_records(path))
+    assert [record["place_id"] for record in records] == ["1", "2"]
+    assert records[0]["latitude"] == 35.5
+
+
+def test_iter_records_rejects_non_list_payload(tmp_path: Path):
+    path = tmp_path / "businesses.json"
+    path.write_text('  {"place_id": "1"}', encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        list(iter_records(path))
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_scan_records_returns_headers_and_count(tmp_path: Path, monkeypatch, streaming):
+    if streaming:
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr("geoapify_places.io.ijson", None)
+    path = tmp_path / "businesses.json"
+    path.write_text('[{"place_id": "1"}, {"place_id": "2", "name": "Shop"}]', encoding="utf-8")
+
+    records, headers, count = scan_records(path)
+    assert headers == ["place_id", "name"]
+    assert count == 2
+    assert [record["place_id"] for record in records] == ["1", "2"]
@@ -0,0 +1,24 @@
+import pytest
+
+from geoapify_places import _json
+
+
+def test_dumps_round_trips_unicode_with_indent():
+    records = [{"name": "Café", "latitude": 35.5}]
+    encoded = _json.dumps(records, indent=True)
+    assert isinstance(encoded, bytes)
+    assert b'\n  {' in encoded
+    assert _json.loads(encoded) == records
+
+
+@pytest.mark.parametrize("backend", ["ujson", "stdlib"])
+def test_loads_fallbacks_raise_json_decode_error(monkeypatch, backend):
+    monkeypatch.setattr(_json, "orjson", None)
+    if backend == "ujson":
+        pytest.importorskip("ujson")
+    else:
+        monkeypatch.setattr(_json, "ujson", None)
+
+    assert _json.loads(memoryview(b'{"features": []}')) == {"features": []}
+    with pytest.raises(_json.JSONDecodeError):
+        _json.loads(b"<html>")
@@ -1,7 +1,13 @@
+import pytest
+
 from geoapify_places.models import (
+    BUSINESS_EXPORT_FIELDS,
     Business,
     business_from_feature,
+    businesses_dataframe_from_feature_collection,
     businesses_from_feature_collection,
+    iter_businesses_from_feature_collection,
+    _normalize_float,
 )
 
 
@@ -38,6 +44,7 @@ def test_business_from_feature_extracts_expected_fields():
     assert business.formatted_address == "123 Main St, Townsville"
     assert business.website == "https://example.com"
     assert business.distance_meters == 25
+    assert not hasattr(business, "__dict__")
 
 
 def test_businesses_from_feature_collection_skips_invalid_entries():
@@ -47,6 +54,34 @@ def test_businesses_from_feature_collection_skips_invalid_entries():
     assert businesses[0].place_id == "demo"
 
 
+def test_businesses_from_feature_collection_prechecks_coordinates():
+    geometry_only = sample_feature()
+    del geometry_only["properties"]["lat"]
+    invalid = [
+        None,
+        {"properties": "oops"},
+        {"properties": {"lat": "n/a", "lon": 1}, "geometry": {"coordinates": [1]}},
+        {"properties": {}, "geometry": {"coordinates": ["x", 2]}},
+    ]
+    businesses = businesses_from_feature_collection({"features": [*invalid, geometry_only]})
+    assert [(b.latitude, b.longitude) for b in businesses] == [(40.0, -70.0)]
+
+
+def test_iter_businesses_from_feature_collection_is_lazy():
+    data = {"features": [sample_feature(), {"properties": {}, "geometry": {}}]}
+    businesses = iter_businesses_from_feature_collection(data)
+    assert next(businesses).place_id == "demo"
+    assert next(businesses, None) is None
+
+
+def test_businesses_share_interned_category_tuples():
+    first, second = businesses_from_feature_collection(
+        {"features": [sample_feature(), sample_feature()]}
+    )
+    assert first.categories == ("commercial", "catering", "cafe")
+    assert first.categories is second.categories
+
+
 def test_business_to_dict_serializes_and_optionally_includes_raw():
     business = business_from_feature(sample_feature())
     data = business.to_dict()
@@ -56,3 +91,79 @@ def test_business_to_dict_serializes_and_optionally_includes_raw():
     data_with_raw = business.to_dict(include_raw=True)
     assert "raw" in data_with_raw
     assert data_with_raw["raw"]["properties"]["name"] == "Coffee Shop"
+
+
+def test_business_to_row_follows_export_fields():
+    business = business_from_feature(sample_feature())
+    data = business.to_dict()
+    assert tuple(data) == BUSINESS_EXPORT_FIELDS
+    row = business.to_row()
+    assert row[4] == ("commercial", "catering", "cafe")
+    assert list(row) == [
+        tuple(value) if isinstance(value, list) else value for value in data.values()
+    ]
+
+
+def test_businesses_dataframe_matches_dataclass_parser():
+    pd = pytest.importorskip("pandas")
+    geometry_only = {
+        "properties": {
+            "name": "Geometry Only",
+            "lat": "invalid",
+            "datasource": {"raw": {"osm_id": 123}},
+            "category": "commercial",
+        },
+        "geometry": {"coordinates": [-71.5, 41.25]},
+    }
+    string_coords = {
+        "properties": {"place_id": "text", "lat": "31.76335715", "lon": "-106.4850217"},
+        "geometry": {},
+    }
+    data = {
+        "features": [
+            sample_feature(),
+            {"properties": {}, "geometry": {}},
+            geometry_only,
+            "not-a-feature",
+            string_coords,
+        ]
+    }
+
+    frame = businesses_dataframe_from_feature_collection(data)
+    expected = [
+        business.to_dict(include_raw=True)
+        for business in businesses_from_feature_collection(data)
+    ]
+    rows = frame.to_dict(orient="records")
+    for row in rows:
+        row["categories"] = list(row["categories"])
+        if pd.isna(row["distance_meters"]):
+            row["distance_meters"] = None
+    assert rows == expected
+    assert frame["place_id"].tolist() == ["demo", "123", "text"]
+    assert frame["latitude"].tolist()[-1] == 31.76335715
+
+
+def test_business_from_feature_place_id_fallbacks():
+    feature = sample_feature()
+    props = feature["properties"]
+    del props["place_id"]
+    props["datasource"] = {"raw": {"osm_id": 42}}
+    assert business_from_feature(feature).place_id == "42"
+
+    props["datasource"] = None
+    assert business_from_feature(feature).place_id == "Coffee Shop"
+
+    del props["name"]
+    first = business_from_feature(feature).place_id
+    assert first.startswith("feature-")
+    assert business_from_feature(sample_feature() | {"properties": props}).place_id == first
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [(1.5, 1.5), (3, 3.0), ("2.5", 2.5), ("n/a", None), (None, None), (True, 1.0), ([1], None)],
+)
+def test_normalize_float_handles_common_types(value, expected):
+    result = _normalize_float(value)
+    assert result == expected and type(result) is type(expected)
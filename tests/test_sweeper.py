@@ -1,10 +1,19 @@
+import asyncio
+import sys
 from pathlib import Path
 from typing import List
 
 import pytest
 
+from geoapify_places.exceptions import GeoapifyClientValidationError
 from geoapify_places.models import Business
-from geoapify_places.sweeper import SweepPoint, read_sweep_points, sweep_businesses
+from geoapify_places.sweeper import (
+    SweepGrid,
+    SweepPoint,
+    asweep_businesses,
+    read_sweep_points,
+    sweep_businesses,
+)
 
 
 class DummyClient:
@@ -17,6 +26,13 @@ class DummyClient:
         self.calls += 1
         return response
 
+    def search_many(self, queries, **kwargs):
+        for query in queries:
+            yield self.search_businesses(query=query)
+
+    async def asearch_businesses(self, **kwargs):
+        return self.search_businesses(**kwargs)
+
 
 def build_business(place_id: str, *, lat: float = 0.0, lon: float = 0.0) -> Business:
     return Business(
@@ -59,8 +75,79 @@ def test_read_sweep_points_with_labels(tmp_path: Path):
     assert points[0].label == "Test City"
 
 
+@pytest.fixture(params=["pandas", "csv"])
+def sweep_reader(request, monkeypatch):
+    if request.param == "csv":
+        monkeypatch.setitem(sys.modules, "pandas", None)
+    else:
+        pytest.importorskip("pandas")
+    return read_sweep_points
+
+
+def test_read_sweep_points_blank_labels_become_none(tmp_path: Path, sweep_reader):
+    csv_content = (
+        "latitude,longitude,radius_m,label\n"
+        "35.0,-80.0,5000.0,  Test City \n"
+        "36.0,-81.0,2500,   \n"
+    )
+    path = tmp_path / "points.csv"
+    path.write_text(csv_content, encoding="utf-8")
+
+    points = sweep_reader(path)
+    assert points == [
+        SweepPoint(latitude=35.0, longitude=-80.0, radius_m=5000, label="Test City"),
+        SweepPoint(latitude=36.0, longitude=-81.0, radius_m=2500, label=None),
+    ]
+
+
+def test_sweep_grid_from_csv_matches_point_reader(tmp_path: Path, sweep_reader):
+    csv_content = (
+        "latitude,longitude,radius_m,label\n"
+        "35.0,-80.0,5000,  Test City \n"
+        "36.0,-81.0,2500.0,\n"
+    )
+    path = tmp_path / "points.csv"
+    path.write_text(csv_content, encoding="utf-8")
+
+    grid = SweepGrid.from_csv(path)
+    assert len(grid) == 2
+    assert list(grid) == sweep_reader(path)
+    assert grid[-1] == SweepPoint(latitude=36.0, longitude=-81.0, radius_m=2500, label=None)
+    assert grid[:1] == SweepGrid.from_points([grid[0]])
+
+
+def test_sweep_grid_rejects_mismatched_columns():
+    with pytest.raises(ValueError):
+        SweepGrid([35.0, 36.0], [-80.0], [5000, 5000])
+
+
+def test_sweep_grid_accepts_float_radii():
+    grid = SweepGrid.from_points([SweepPoint(latitude=1.0, longitude=2.0, radius_m=5000.0)])
+    assert grid[0] == SweepPoint(latitude=1.0, longitude=2.0, radius_m=5000)
+
+
+@pytest.mark.parametrize(
+    "csv_content",
+    [
+        "latitude,longitude\n35.0,-80.0\n",
+        "latitude,longitude,radius_m\n35.0,oops,5000\n",
+        "latitude,longitude,radius_m\n35.0,,5000\n",
+        "latitude,longitude,radius_m\n",
+    ],
+)
+def test_read_sweep_points_rejects_invalid_files(tmp_path: Path, sweep_reader, csv_content):
+    path = tmp_path / "points.csv"
+    path.write_text(csv_content, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        sweep_reader(path)
+
+
 def test_sweep_businesses_deduplicates_overlapping_results():
-    point = SweepPoint(latitude=35.0, longitude=-80.0, radius_m=5000)
+    points = [
+        SweepPoint(latitude=35.0, longitude=-80.0, radius_m=5000),
+        SweepPoint(latitude=35.1, longitude=-80.0, radius_m=5000),
+    ]
     duplicate_business = build_business("dup")
     client = DummyClient(
         responses=[
@@ -69,7 +156,109 @@ def test_sweep_businesses_deduplicates_overlapping_results():
         ]
     )
 
-    businesses = sweep_businesses(client, [point, point])
+    businesses = sweep_businesses(client, points)
     assert len(businesses) == 2
     ids = {business.place_id for business in businesses}
     assert ids == {"dup", "unique"}
+
+
+def test_asweep_businesses_deduplicates_overlapping_results():
+    points = [
+        SweepPoint(latitude=35.0, longitude=-80.0, radius_m=5000),
+        SweepPoint(latitude=35.1, longitude=-80.0, radius_m=5000),
+    ]
+    duplicate_business = build_business("dup")
+    client = DummyClient(
+        responses=[
+            [duplicate_business, build_business("unique")],
+            [duplicate_business],
+        ]
+    )
+
+    businesses = asyncio.run(asweep_businesses(client, points, max_concurrency=1))
+    assert [business.place_id for business in businesses] == ["dup", "unique"]
+
+
+def test_asweep_businesses_validates_max_concurrency():
+    client = DummyClient(responses=[])
+    with pytest.raises(GeoapifyClientValidationError):
+        asyncio.run(asweep_businesses(client, [], max_concurrency=0))
+
+
+def test_sweep_businesses_skips_repeated_points():
+    point = SweepPoint(latitude=35.0, longitude=-80.0, radius_m=5000)
+    repeat = SweepPoint(latitude=35.0, longitude=-80.0, radius_m=5000, label="copy")
+    nearby = SweepPoint(latitude=35.00001, longitude=-80.0, radius_m=5000)
+    wider = SweepPoint(latitude=35.0, longitude=-80.0, radius_m=8000)
+    client = DummyClient(
+        responses=[[build_business("a")], [build_business("b")], [build_business("c")]]
+    )
+
+    businesses = sweep_businesses(client, [point, repeat, nearby, wider])
+    assert client.calls == 3
+    assert [business.place_id for business in businesses] == ["a", "b", "c"]
+
+
+def test_sweep_businesses_reuses_disk_cache(tmp_path: Path):
+    points = [
+        SweepPoint(latitude=35.0, longitude=-80.0, radius_m=5000),
+        SweepPoint(latitude=36.0, longitude=-81.0, radius_m=5000),
+    ]
+    client = DummyClient(responses=[[build_business("a")], [build_business("b")]])
+    first = sweep_businesses(client, points, cache_dir=tmp_path)
+    assert client.calls == 2
+
+    extra = SweepPoint(latitude=37.0, longitude=-82.0, radius_m=5000)
+    client = DummyClient(responses=[[build_business("c")]])
+    second = sweep_businesses(client, [*points, extra], cache_dir=tmp_path)
+    assert client.calls == 1
+    assert second == [*first, build_business("c")]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_sweep_businesses_refetches_unreadable_cache_entries(tmp_path: Path):
+    point = SweepPoint(latitude=35.0, longitude=-80.0, radius_m=5000)
+    client = DummyClient(responses=[[build_business("a")]])
+    sweep_businesses(client, [point], cache_dir=tmp_path)
+    (entry,) = tmp_path.glob("*.pkl")
+    entry.write_bytes(b"not a pickle")
+
+    client = DummyClient(responses=[[build_business("b")]])
+    businesses = sweep_businesses(client, [point], cache_dir=tmp_path)
+    assert client.calls == 1
+    assert businesses == [build_business("b")]
+
+    client = DummyClient(responses=[])
+    assert sweep_businesses(client, [point], cache_dir=tmp_path) == businesses
+    assert client.calls == 0
+
+
+def test_sweep_businesses_accepts_sweep_grid():
+    grid = SweepGrid([35.0, 35.0, 36.0], [-80.0, -80.0, -81.0], [5000, 5000, 5000])
+    client = DummyClient(responses=[[build_business("a")], [build_business("b")]])
+
+    businesses = sweep_businesses(client, grid)
+    assert client.calls == 2
+    assert [business.place_id for business in businesses] == ["a", "b"]
+
+
+def test_asweep_businesses_spaces_out_request_starts(monkeypatch):
+    clock = {"now": 0.0}
+    delays = []
+
+    async def fake_sleep(seconds):
+        delays.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr("geoapify_places.client.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr("geoapify_places.sweeper.asyncio.sleep", fake_sleep)
+    points = [
+        SweepPoint(latitude=35.0 + index, longitude=-80.0, radius_m=5000) for index in range(3)
+    ]
+    client = DummyClient(responses=[[], [], []])
+
+    businesses = asyncio.run(
+        asweep_businesses(client, points, max_concurrency=1, rate_limit_per_sec=2)
+    )
+    assert businesses == []
+    assert delays == [0.5, 0.5]
@@ -1,4 +1,6 @@
-from geoapify_places.visualization import collect_coordinates
+import pytest
+
+from geoapify_places.visualization import collect_coordinates, collect_coordinates_array
 
 
 def test_collect_coordinates_filters_invalid_values():
@@ -12,3 +14,24 @@ def test_collect_coordinates_filters_invalid_values():
     coords = collect_coordinates(records)
     assert coords == [(35.0, -80.0), (34.5, -82.0)]
 
+
+
+def test_collect_coordinates_array_matches_tuple_version():
+    records = [
+        {"latitude": 35.0, "longitude": -80.0},
+        {"latitude": "34.5", "longitude": "-82.0"},
+        {"latitude": None, "longitude": -81.0},
+        {"latitude": 36.0, "longitude": "invalid"},
+    ]
+
+    coords = collect_coordinates_array(records)
+    assert coords.shape == (2, 2)
+    assert coords.tolist() == [[35.0, -80.0], [34.5, -82.0]]
+
+
+def test_collect_coordinates_array_accepts_dataframes():
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame({"lat": [35.0, None, "36.5"], "lon": [-80.0, -81.0, "-79"]})
+
+    coords = collect_coordinates_array(frame, lat_key="lat", lon_key="lon")
+    assert coords.tolist() == [[35.0, -80.0], [36.5, -79.0]]